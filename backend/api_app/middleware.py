@@ -0,0 +1,20 @@
+"""
+Middleware for the ear trainer API.
+"""
+
+from django.middleware.gzip import GZipMiddleware
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves audio responses alone.
+
+    WAV and MP3 files barely shrink under gzip, and compressing a streamed
+    FileResponse drops its Content-Length and keeps it off the sendfile path.
+    """
+
+    def process_response(self, request, response):
+        """Compress the response unless it carries audio."""
+        if response.get("Content-Type", "").startswith("audio/"):
+            return response
+        return super().process_response(request, response)
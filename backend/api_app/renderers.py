@@ -0,0 +1,28 @@
+"""
+Renderers for the ear trainer API.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    The API views return plain dicts and lists, which orjson encodes several
+    times faster than the stdlib encoder used by DRF's JSONRenderer. Types
+    orjson does not handle natively (Decimal, lazy translation strings, ...)
+    fall back to DRF's JSONEncoder.
+    """
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into compact JSON bytes."""
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS
+        )
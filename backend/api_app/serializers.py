@@ -21,33 +21,32 @@ class ExerciseListSerializer(serializers.Serializer):
     answer_format = serializers.CharField()
 
 
-class ExerciseDataSerializer(serializers.Serializer):
-    """Serializer for exercise data responses."""
+# Response keys of ExerciseListSerializer, resolved once at import time
+_METADATA_KEYS = tuple(ExerciseListSerializer().fields.keys())
 
-    key = serializers.CharField()
-    scale = serializers.ListField(child=serializers.CharField())
-    progression_audio = serializers.CharField(allow_null=True)
-    target_audio = serializers.CharField(allow_null=True)
-    options = serializers.ListField()
-    correct_answer = serializers.CharField()
-    context = serializers.DictField()
 
+def metadata_to_dict(metadata) -> dict:
+    """
+    Build the ExerciseListSerializer representation of exercise metadata.
 
-class AnswerCheckSerializer(serializers.Serializer):
-    """Serializer for answer check requests."""
+    Metadata fields are already plain scalars and lists of strings, so the
+    output matches ``ExerciseListSerializer(metadata).data`` without binding
+    and walking the serializer fields on every call.
 
-    answer = serializers.CharField()
+    Args:
+        metadata: ExerciseMetadata instance
 
+    Returns:
+        dict: Serialized exercise metadata
+    """
+    return {key: getattr(metadata, key) for key in _METADATA_KEYS}
 
-class AnswerResultSerializer(serializers.Serializer):
-    """Serializer for answer check responses."""
 
-    is_correct = serializers.BooleanField()
-    user_answer = serializers.CharField()
-    correct_answer = serializers.CharField()
-    feedback = serializers.CharField()
-    hints_used = serializers.ListField(child=serializers.CharField(), required=False)
-    time_taken = serializers.IntegerField(required=False)
+class AnswerCheckSerializer(serializers.Serializer):
+    """Serializer for answer check requests."""
+
+    answer = serializers.CharField()
+    context = serializers.DictField(required=False, default=dict)
 
 
 class ExerciseGenerateSerializer(serializers.Serializer):
@@ -56,7 +55,9 @@ class ExerciseGenerateSerializer(serializers.Serializer):
     key = serializers.CharField(required=False)
     difficulty = serializers.IntegerField(required=False, min_value=1, max_value=10)
     progression_type = serializers.CharField(required=False)
-    octave = serializers.IntegerField(required=False, min_value=1, max_value=8)
+    # Interval exercises reach an octave above the reference note: B-8 (MIDI
+    # 119) from B-7, but B-9 (MIDI 131, past the MIDI range) from B-8
+    octave = serializers.IntegerField(required=False, min_value=1, max_value=7)
 
 
 class ErrorSerializer(serializers.Serializer):
@@ -2,374 +2,708 @@
 API views for the ear trainer.
 """
 
+import gzip
+import hashlib
 import logging
 import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from functools import cached_property
+from importlib import import_module
 from pathlib import Path
+from types import MappingProxyType
 
+import orjson
+from audio_app.synthesizer import AudioSynthesizer
 from django.conf import settings
-
-from exercises.level1.combined_intervals_melodic import (
-    CombinedIntervalsMelodicExercise,
+from django.core import signing
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
 )
+from django.utils.http import content_disposition_header, quote_etag
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+from rest_framework.views import APIView, exception_handler
 
-# Simple exercise registry - we'll import exercises directly
-from exercises.level1.interval_recognition import (
-    MinorThirdMajorThirdOctaveMelodicExercise,
-)
-from exercises.level1.perfect_intervals_harmonic import (
-    PerfectFourthPerfectFifthOctaveHarmonicExercise,
-)
-from exercises.level1.perfect_intervals_melodic import (
-    PerfectFourthPerfectFifthOctaveMelodicExercise,
-)
-from exercises.level1.thirds_octave_harmonic import (
-    MinorThirdMajorThirdOctaveHarmonicExercise,
+from .serializers import (
+    AnswerCheckSerializer,
+    ExerciseGenerateSerializer,
+    metadata_to_dict,
 )
 
+# How long clients and shared caches may reuse static exercise payloads
+STATIC_PAYLOAD_MAX_AGE = 3600
+
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+def json_etag(content):
+    """Build a strong ETag for a serialized JSON payload."""
+    return quote_etag(hashlib.blake2b(content, digest_size=16).hexdigest())
+
+
+def gzip_payload(content):
+    """
+    Precompress a static payload.
+
+    Returns:
+        bytes: Gzipped content, or None when compression does not shrink it
+    """
+    compressed = gzip.compress(content, compresslevel=6, mtime=0)
+    if len(compressed) >= len(content):
+        return None
+    return compressed
+
+
+def cached_json_response(request, content, etag, content_gz=None):
+    """
+    Build a cacheable JSON response for a static payload.
+
+    The precompressed content_gz is sent instead of content when the client
+    accepts gzip. Returns 304 Not Modified when the request's If-None-Match
+    matches etag.
+    """
+    if content_gz is not None:
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if ACCEPTS_GZIP_RE.search(accept_encoding):
+            response = HttpResponse(content_gz, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+            # Weakened as GZipMiddleware does, so either body matches the ETag
+            etag = f"W/{etag}"
+        else:
+            response = HttpResponse(content, content_type="application/json")
+        patch_vary_headers(response, ("Accept-Encoding",))
+    else:
+        response = HttpResponse(content, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=STATIC_PAYLOAD_MAX_AGE)
+    return get_conditional_response(request, etag=etag, response=response)
+
 
 # Simple exercise registry replacement
 class SimpleExerciseRegistry:
-    def __init__(self):
-        self.exercises = {
-            # New exercises
-            "minor_third_major_third_octave_melodic": MinorThirdMajorThirdOctaveMelodicExercise(),
-            "perfect_fourth_fifth_octave_melodic": PerfectFourthPerfectFifthOctaveMelodicExercise(),
-            "minor_third_major_third_octave_harmonic": MinorThirdMajorThirdOctaveHarmonicExercise(),
-            "perfect_fourth_fifth_octave_harmonic": PerfectFourthPerfectFifthOctaveHarmonicExercise(),
-            "combined_intervals_melodic": CombinedIntervalsMelodicExercise(),
+    # Exercise ID -> (module, class name). Modules are imported on first use,
+    # so a worker only loads the exercises it actually serves. Read-only:
+    # the payloads built from it assume the exercise set never changes
+    EXERCISE_CLASSES = MappingProxyType(
+        {
+            "minor_third_major_third_octave_melodic": (
+                "exercises.level1.interval_recognition",
+                "MinorThirdMajorThirdOctaveMelodicExercise",
+            ),
+            "perfect_fourth_fifth_octave_melodic": (
+                "exercises.level1.perfect_intervals_melodic",
+                "PerfectFourthPerfectFifthOctaveMelodicExercise",
+            ),
+            "minor_third_major_third_octave_harmonic": (
+                "exercises.level1.thirds_octave_harmonic",
+                "MinorThirdMajorThirdOctaveHarmonicExercise",
+            ),
+            "perfect_fourth_fifth_octave_harmonic": (
+                "exercises.level1.perfect_intervals_harmonic",
+                "PerfectFourthPerfectFifthOctaveHarmonicExercise",
+            ),
+            "combined_intervals_melodic": (
+                "exercises.level1.combined_intervals_melodic",
+                "CombinedIntervalsMelodicExercise",
+            ),
         }
+    )
+
+    def __init__(self):
+        self._instances = {}
+
+        # Exercises never change once loaded, so their detail and
+        # instructions payloads are serialized once, on first use
+        self._metadata_dicts = {}
+        self._metadata_json = {}
+        self._metadata_etags = {}
+        self._instructions_json = {}
+        self._instructions_gz = {}
+        self._instructions_etags = {}
+
+    def _load(self, exercise_id):
+        exercise = self._instances.get(exercise_id)
+        if exercise is not None or exercise_id not in self.EXERCISE_CLASSES:
+            return exercise
+
+        module_name, class_name = self.EXERCISE_CLASSES[exercise_id]
+        exercise = getattr(import_module(module_name), class_name)()
+
+        metadata_dict = metadata_to_dict(exercise.metadata)
+        metadata_json = orjson.dumps(metadata_dict)
+        self._metadata_dicts[exercise_id] = metadata_dict
+        self._metadata_json[exercise_id] = metadata_json
+        self._metadata_etags[exercise_id] = json_etag(metadata_json)
+
+        # Instructions and hints are static per exercise as well
+        instructions_json = orjson.dumps(
+            {"instructions": exercise.get_instructions(), "hints": exercise.get_hints()}
+        )
+        self._instructions_json[exercise_id] = instructions_json
+        self._instructions_gz[exercise_id] = gzip_payload(instructions_json)
+        self._instructions_etags[exercise_id] = json_etag(instructions_json)
+
+        # Published last so concurrent readers never see partial payloads
+        self._instances[exercise_id] = exercise
+        return exercise
+
+    @cached_property
+    def _exercise_list_cache(self):
+        return [
+            self.get_exercise_metadata(exercise_id)
+            for exercise_id in self.EXERCISE_CLASSES
+        ]
+
+    @cached_property
+    def _serialized_json(self):
+        return orjson.dumps(self._exercise_list_cache)
+
+    @cached_property
+    def _serialized_json_gz(self):
+        return gzip_payload(self._serialized_json)
+
+    @cached_property
+    def _etag(self):
+        return json_etag(self._serialized_json)
 
     def get_exercise_count(self):
-        return len(self.exercises)
+        return len(self.EXERCISE_CLASSES)
 
     def get_exercise_list(self):
-        return [exercise.metadata for exercise in self.exercises.values()]
+        return self._exercise_list_cache
+
+    def get_exercise_list_json(self):
+        return self._serialized_json
+
+    def get_exercise_list_json_gz(self):
+        return self._serialized_json_gz
+
+    def get_exercise_list_etag(self):
+        return self._etag
 
     def get_exercise_metadata(self, exercise_id):
-        if exercise_id in self.exercises:
-            return self.exercises[exercise_id].metadata
-        return None
+        self._load(exercise_id)
+        return self._metadata_dicts.get(exercise_id)
+
+    def get_exercise_metadata_json(self, exercise_id):
+        self._load(exercise_id)
+        return self._metadata_json.get(exercise_id)
+
+    def get_exercise_metadata_etag(self, exercise_id):
+        self._load(exercise_id)
+        return self._metadata_etags.get(exercise_id)
+
+    def get_instructions_json(self, exercise_id):
+        self._load(exercise_id)
+        return self._instructions_json.get(exercise_id)
+
+    def get_instructions_json_gz(self, exercise_id):
+        self._load(exercise_id)
+        return self._instructions_gz.get(exercise_id)
+
+    def get_instructions_etag(self, exercise_id):
+        self._load(exercise_id)
+        return self._instructions_etags.get(exercise_id)
 
     def get_exercise(self, exercise_id):
-        return self.exercises.get(exercise_id)
+        return self._load(exercise_id)
 
 
 exercise_registry = SimpleExerciseRegistry()
-from django.http import FileResponse
-from rest_framework import status
-from rest_framework.parsers import JSONParser
-from rest_framework.response import Response
-from rest_framework.views import APIView
 
-from .serializers import (
-    AnswerCheckSerializer,
-    AnswerResultSerializer,
-    ExerciseDataSerializer,
-    ExerciseListSerializer,
-)
+# The API root document only depends on the registry, so it is built once
+API_ROOT_DOC = {
+    "name": "Open Ear Trainer API",
+    "version": "1.0.0",
+    "description": "A scalable ear training web application for musicians",
+    "endpoints": {
+        "exercises": {
+            "list": "/api/exercises/",
+            "detail": "/api/exercises/{id}/",
+            "generate": "/api/exercises/{id}/generate/",
+            "check": "/api/exercises/{id}/check/",
+            "instructions": "/api/exercises/{id}/instructions/",
+        },
+        "audio": {"file": "/api/audio/{filename}/"},
+    },
+    "available_exercises": exercise_registry.get_exercise_count(),
+    "documentation": "https://github.com/estebanfoucher/open-ear-trainer",
+}
+API_ROOT_JSON = orjson.dumps(API_ROOT_DOC)
+API_ROOT_ETAG = json_etag(API_ROOT_JSON)
+
+
+def audio_file_candidates(filename):
+    """
+    List the locations an audio file may be stored in.
+
+    Args:
+        filename: Audio filename as used in /api/audio/{filename}/ URLs
+
+    Returns:
+        list: (path relative to MEDIA_ROOT/audio, absolute path) pairs
+    """
+    audio_root = os.path.join(settings.MEDIA_ROOT, "audio")
+    return [
+        (relative_path, os.path.join(audio_root, relative_path))
+        for relative_path in (filename, f"cache/{filename}")
+    ]
+
+
+def audio_files_exist(exercise_data):
+    """Check that every audio file referenced by exercise data is on disk."""
+    for url in (exercise_data.progression_audio, exercise_data.target_audio):
+        if url is None:
+            continue
+        filename = url.rstrip("/").rpartition("/")[2]
+        if not any(Path(path).is_file() for _, path in audio_file_candidates(filename)):
+            return False
+    return True
+
+
+# Generated data for deterministic configurations, least recently used first:
+# (exercise ID, config items) -> ExerciseData
+GENERATE_MEMO_SIZE = 1024
+_generate_memo: OrderedDict = OrderedDict()
+_generate_memo_lock = threading.Lock()
+
+
+def _generate_cached(exercise_id, config_items, refresh=False):
+    """
+    Generate exercise data for a deterministic configuration.
+
+    Args:
+        exercise_id: Registered exercise ID
+        config_items: Sorted tuple of (key, value) configuration pairs
+        refresh: Generate again and replace the memoized entry, if any
+
+    Returns:
+        ExerciseData: Generated data, shared between identical requests
+    """
+    key = (exercise_id, config_items)
+    if not refresh:
+        with _generate_memo_lock:
+            exercise_data = _generate_memo.get(key)
+            if exercise_data is not None:
+                _generate_memo.move_to_end(key)
+                return exercise_data
+
+    exercise = exercise_registry.get_exercise(exercise_id)
+    exercise_data = exercise.generate(**dict(config_items))
+    with _generate_memo_lock:
+        _generate_memo[key] = exercise_data
+        _generate_memo.move_to_end(key)
+        while len(_generate_memo) > GENERATE_MEMO_SIZE:
+            _generate_memo.popitem(last=False)
+    return exercise_data
+
+
+def clear_generate_memo():
+    """Forget every memoized exercise question."""
+    with _generate_memo_lock:
+        _generate_memo.clear()
+
 
 logger = logging.getLogger(__name__)
 
 
+def api_exception_handler(exc, context):
+    """
+    Handle errors raised by API views.
+
+    Errors DRF knows about (validation, 404, ...) keep its standard handling;
+    anything else is logged and turned into a 500 carrying the view's
+    error_message.
+
+    Args:
+        exc: The raised exception
+        context: DRF exception context with the view, args and kwargs
+
+    Returns:
+        Response: Error response for the client
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    message = getattr(context["view"], "error_message", "Internal server error")
+    logger.error("%s: %s", message, context["kwargs"], exc_info=exc)
+    return Response(
+        {"error": "internal_error", "message": message},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+# Signed answer tokens let ExerciseCheckView recover the correct answer of a
+# generated question without server-side state or regenerating it
+ANSWER_TOKEN_SALT = "api_app.answer"
+ANSWER_TOKEN_MAX_AGE = 3600
+
+# Content types of the audio formats served by AudioFileView
+AUDIO_CONTENT_TYPES = {".wav": "audio/wav", ".mp3": "audio/mpeg"}
+
+# Single byte range, e.g. "bytes=0-1023", "bytes=1024-" or "bytes=-512"
+BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Audio filenames are unique or derived from the synthesis parameters, so a
+# given URL always serves the same bytes
+AUDIO_MAX_AGE = 86400
+
+
 class APIRootView(APIView):
     """API root with documentation."""
 
     def get(self, request):
         """Get API documentation and available endpoints."""
-        return Response(
-            {
-                "name": "Open Ear Trainer API",
-                "version": "1.0.0",
-                "description": "A scalable ear training web application for musicians",
-                "endpoints": {
-                    "exercises": {
-                        "list": "/api/exercises/",
-                        "detail": "/api/exercises/{id}/",
-                        "generate": "/api/exercises/{id}/generate/",
-                        "check": "/api/exercises/{id}/check/",
-                        "instructions": "/api/exercises/{id}/instructions/",
-                    },
-                    "audio": {"file": "/api/audio/{filename}/"},
-                },
-                "available_exercises": exercise_registry.get_exercise_count(),
-                "documentation": "https://github.com/estebanfoucher/open-ear-trainer",
-            }
-        )
+        return cached_json_response(request, API_ROOT_JSON, API_ROOT_ETAG)
 
 
 class ExerciseListView(APIView):
     """List all available exercises."""
 
+    error_message = "Failed to get exercise list"
+
     def get(self, request):
         """Get list of all exercises."""
-        try:
-            exercises = exercise_registry.get_exercise_list()
-            serializer = ExerciseListSerializer(exercises, many=True)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"Error getting exercise list: {e}")
-            return Response(
-                {"error": "internal_error", "message": "Failed to get exercise list"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        return cached_json_response(
+            request,
+            exercise_registry.get_exercise_list_json(),
+            exercise_registry.get_exercise_list_etag(),
+            exercise_registry.get_exercise_list_json_gz(),
+        )
 
 
 class ExerciseDetailView(APIView):
     """Get details of a specific exercise."""
 
+    error_message = "Failed to get exercise details"
+
     def get(self, request, exercise_id):
         """Get exercise details by ID."""
-        try:
-            metadata = exercise_registry.get_exercise_metadata(exercise_id)
-            if not metadata:
-                return Response(
-                    {
-                        "error": "not_found",
-                        "message": f"Exercise {exercise_id} not found",
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            # Convert metadata to dict for serialization
-            exercise_data = {
-                "id": metadata.id,
-                "name": metadata.name,
-                "description": metadata.description,
-                "difficulty": metadata.difficulty,
-                "category": metadata.category,
-                "tags": metadata.tags,
-                "estimated_time": metadata.estimated_time,
-                "prerequisites": metadata.prerequisites,
-                "learning_objectives": metadata.learning_objectives,
-                "input_type": metadata.input_type,
-                "answer_format": metadata.answer_format,
-                "requires_progression": metadata.requires_progression,
-                "requires_single_note": metadata.requires_single_note,
-                "audio_duration": metadata.audio_duration,
-                "config_options": metadata.config_options,
-            }
-
-            serializer = ExerciseListSerializer(exercise_data)
-            return Response(serializer.data)
-
-        except Exception as e:
-            logger.error(f"Error getting exercise details for {exercise_id}: {e}")
+        metadata_json = exercise_registry.get_exercise_metadata_json(exercise_id)
+        if metadata_json is None:
             return Response(
                 {
-                    "error": "internal_error",
-                    "message": "Failed to get exercise details",
+                    "error": "not_found",
+                    "message": f"Exercise {exercise_id} not found",
                 },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status=status.HTTP_404_NOT_FOUND,
             )
 
+        return cached_json_response(
+            request,
+            metadata_json,
+            exercise_registry.get_exercise_metadata_etag(exercise_id),
+        )
+
 
 class ExerciseGenerateView(APIView):
     """Generate a new exercise instance."""
 
+    error_message = "Failed to generate exercise"
+
     parser_classes = [JSONParser]
 
     def get(self, request, exercise_id):
         """Generate a new exercise instance."""
-        try:
-            # Get the exercise class
-            exercise_class = exercise_registry.get_exercise(exercise_id)
-            if not exercise_class:
-                return Response(
-                    {
-                        "error": "not_found",
-                        "message": f"Exercise {exercise_id} not found",
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        exercise = exercise_registry.get_exercise(exercise_id)
+        if not exercise:
+            return Response(
+                {
+                    "error": "not_found",
+                    "message": f"Exercise {exercise_id} not found",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-            # Parse query parameters for configuration
-            config = {}
-            # Handle both DRF Request and Django WSGIRequest
-            if hasattr(request, "query_params"):
-                query_params = request.query_params
-            else:
-                query_params = request.GET
+        # Validate the query parameters the API knows about
+        serializer = ExerciseGenerateSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    "error": "validation_error",
+                    "message": "Invalid query parameters",
+                    "details": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-            for key, value in query_params.items():
-                config[key] = value
+        # Build the configuration, keeping only the keys the exercise
+        # understands so stray params never reach generate() or the
+        # memoization key
+        config = {
+            key: serializer.validated_data.get(key, value)
+            for key, value in request.query_params.items()
+            if key in exercise.generate_params
+        }
 
-            # Get exercise instance and generate data
-            exercise = exercise_class
+        if exercise.is_deterministic(config):
+            config_items = tuple(sorted(config.items()))
+            exercise_data = _generate_cached(exercise_id, config_items)
+            # Memoized entries outlive files removed from the audio cache;
+            # when that happens, synthesize again and replace only that entry
+            if not audio_files_exist(exercise_data):
+                exercise_data = _generate_cached(
+                    exercise_id, config_items, refresh=True
+                )
+        else:
             exercise_data = exercise.generate(**config)
 
-            # Convert to dict for serialization
-            data_dict = {
-                "key": exercise_data.key,
-                "scale": exercise_data.scale,
-                "progression_audio": exercise_data.progression_audio,
-                "target_audio": exercise_data.target_audio,
-                "options": exercise_data.options,
+        # Copy the context rather than mutating it: cached exercise data is
+        # shared between requests
+        answer_token = signing.dumps(
+            {
+                "exercise_id": exercise_id,
                 "correct_answer": exercise_data.correct_answer,
-                "context": exercise_data.context,
-            }
-
-            serializer = ExerciseDataSerializer(data=data_dict)
-            if serializer.is_valid():
-                return Response(serializer.data)
-            else:
-                return Response(
-                    {
-                        "error": "validation_error",
-                        "message": "Invalid exercise data",
-                        "details": serializer.errors,
-                    },
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            },
+            salt=ANSWER_TOKEN_SALT,
+            compress=True,
+        )
+        exercise_data = replace(
+            exercise_data,
+            context={**exercise_data.context, "answer_token": answer_token},
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating exercise {exercise_id}: {e}")
-            return Response(
-                {"error": "internal_error", "message": "Failed to generate exercise"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        # Exercise data is produced server-side, so the ExerciseData
+        # dataclass is encoded by orjson directly instead of being copied into
+        # a dict and re-validated
+        return HttpResponse(
+            orjson.dumps(exercise_data), content_type="application/json"
+        )
 
 
 class ExerciseCheckView(APIView):
     """Check an answer for an exercise."""
 
+    error_message = "Failed to check answer"
+
     parser_classes = [JSONParser]
 
     def post(self, request, exercise_id):
         """Check if the user's answer is correct."""
-        try:
-            # Get the exercise class
-            exercise_class = exercise_registry.get_exercise(exercise_id)
-            if not exercise_class:
-                return Response(
-                    {
-                        "error": "not_found",
-                        "message": f"Exercise {exercise_id} not found",
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        exercise = exercise_registry.get_exercise(exercise_id)
+        if not exercise:
+            return Response(
+                {
+                    "error": "not_found",
+                    "message": f"Exercise {exercise_id} not found",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-            # Validate request data
-            serializer = AnswerCheckSerializer(data=request.data)
-            if not serializer.is_valid():
+        # Validate request data
+        serializer = AnswerCheckSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    "error": "validation_error",
+                    "message": "Invalid request data",
+                    "details": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Get exercise context from the request. The correct answer comes
+        # from the signed token issued by ExerciseGenerateView when present,
+        # so the question never has to be generated again
+        context = serializer.validated_data["context"]
+        answer_token = context.get("answer_token")
+        if answer_token:
+            payload = None
+            # Only strings can be signed tokens; anything else is rejected
+            # like a forged one
+            if isinstance(answer_token, str):
+                try:
+                    payload = signing.loads(
+                        answer_token,
+                        salt=ANSWER_TOKEN_SALT,
+                        max_age=ANSWER_TOKEN_MAX_AGE,
+                    )
+                except signing.BadSignature:
+                    pass
+            # Tokens only answer questions of the exercise that issued them
+            if not isinstance(payload, dict) or payload["exercise_id"] != exercise_id:
                 return Response(
                     {
                         "error": "validation_error",
-                        "message": "Invalid request data",
-                        "details": serializer.errors,
+                        "message": "Invalid or expired answer token",
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            context = {**context, "correct_answer": payload["correct_answer"]}
 
-            # Get exercise context from session or request
-            # For now, we'll need to pass context somehow
-            # This is a simplified version - in a real app, you'd store context in session/DB
-            context = request.data.get("context", {})
-
-            # Create exercise instance and check answer
-            exercise = exercise_class()
-            result = exercise.check_answer(serializer.validated_data["answer"], context)
-
-            # Convert result to dict for serialization
-            result_dict = {
-                "is_correct": result.is_correct,
-                "user_answer": result.user_answer,
-                "correct_answer": result.correct_answer,
-                "feedback": result.feedback,
-                "hints_used": result.hints_used,
-                "time_taken": result.time_taken,
-            }
-
-            result_serializer = AnswerResultSerializer(result_dict)
-            if result_serializer.is_valid():
-                return Response(result_serializer.data)
-            else:
-                return Response(
-                    {
-                        "error": "validation_error",
-                        "message": "Invalid result data",
-                        "details": result_serializer.errors,
-                    },
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+        result = exercise.check_answer(serializer.validated_data["answer"], context)
 
-        except Exception as e:
-            logger.error(f"Error checking answer for exercise {exercise_id}: {e}")
-            return Response(
-                {"error": "internal_error", "message": "Failed to check answer"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        # The result is built by the exercise itself, so the ExerciseResult
+        # dataclass is encoded as is rather than re-validated
+        return HttpResponse(orjson.dumps(result), content_type="application/json")
 
 
 class AudioFileView(APIView):
     """Serve generated audio files."""
 
-    def get(self, request, filename):
-        """Serve an audio file."""
-        try:
-            # Construct file path (supports cached files)
-            primary_path = os.path.join(settings.MEDIA_ROOT, "audio", filename)
-            cache_path = os.path.join(settings.MEDIA_ROOT, "audio", "cache", filename)
-            file_path = primary_path if os.path.exists(primary_path) else cache_path
-
-            # Check if file exists in either location
-            if not os.path.exists(file_path):
-                return Response(
-                    {
-                        "error": "not_found",
-                        "message": f"Audio file {filename} not found",
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
+    error_message = "Failed to serve audio file"
+
+    def _partial_response(self, file_handle, range_header, content_type):
+        """
+        Serve a single byte range of an open audio file.
+
+        Args:
+            file_handle: Open binary file, closed when a response is built
+            range_header: Value of the Range request header
+            content_type: Content type of the audio file
+
+        Returns:
+            HttpResponse: 206 Partial Content or 416 Range Not Satisfiable, or
+            None when the header should be ignored and the whole file sent
+        """
+        match = BYTE_RANGE_RE.match(range_header)
+        if not match:
+            return None
+        first, last = match.groups()
+        size = os.fstat(file_handle.fileno()).st_size
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            end = min(int(last), size - 1) if last else size - 1
+        elif last:
+            # Suffix range: the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+        else:
+            return None
+
+        with file_handle:
+            if start > end:
+                response = HttpResponse(
+                    status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
                 )
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+            body = os.pread(file_handle.fileno(), end - start + 1, start)
 
-            # Determine content type based on file extension
-            if filename.endswith(".wav"):
-                content_type = "audio/wav"
-            elif filename.endswith(".mp3"):
-                content_type = "audio/mpeg"
-            else:
-                content_type = "audio/wav"  # Default
-
-            # Serve the file
-            file_handle = open(file_path, "rb")  # noqa: SIM115
-            response = FileResponse(
-                file_handle, content_type=content_type, filename=filename
+        response = HttpResponse(
+            body, status=status.HTTP_206_PARTIAL_CONTENT, content_type=content_type
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        return response
+
+    def get(self, request, filename):
+        """Serve an audio file."""
+        # Refuse names that could point outside the audio directory and
+        # unknown formats before touching the filesystem
+        if filename.startswith(".") or any(char in filename for char in "/\\\0"):
+            return Response(
+                {
+                    "error": "validation_error",
+                    "message": f"Invalid audio filename {filename}",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        content_type = AUDIO_CONTENT_TYPES.get(Path(filename).suffix.lower())
+        if content_type is None:
+            return Response(
+                {
+                    "error": "unsupported_media_type",
+                    "message": f"Unsupported audio format for {filename}",
+                },
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             )
-            response["Content-Length"] = Path(file_path).stat().st_size
-            return response
 
-        except Exception as e:
-            logger.error(f"Error serving audio file {filename}: {e}")
+        # Cache files never change once written, so hot ones are served from
+        # memory unless nginx or a Range request takes over
+        accel_prefix = getattr(settings, "AUDIO_X_ACCEL_REDIRECT_PREFIX", "")
+        if not accel_prefix and "HTTP_RANGE" not in request.META:
+            _, cache_path = audio_file_candidates(filename)[-1]
+            content = AudioSynthesizer.get_cached_bytes(cache_path)
+            if content is not None:
+                response = HttpResponse(content, content_type=content_type)
+                response["Content-Disposition"] = content_disposition_header(
+                    False, filename
+                )
+                response["Accept-Ranges"] = "bytes"
+                patch_cache_control(
+                    response, public=True, max_age=AUDIO_MAX_AGE, immutable=True
+                )
+                return response
+
+        # Open the file directly in either location (supports cached files);
+        # a failed open replaces a separate existence check
+        file_handle = None
+        for relative_path, file_path in audio_file_candidates(filename):  # noqa: B007
+            try:
+                file_handle = open(file_path, "rb")  # noqa: SIM115
+            except (FileNotFoundError, IsADirectoryError):
+                continue
+            break
+        if file_handle is None:
             return Response(
-                {"error": "internal_error", "message": "Failed to serve audio file"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {
+                    "error": "not_found",
+                    "message": f"Audio file {filename} not found",
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Let nginx send the file when running behind it
+        if accel_prefix:
+            file_handle.close()
+            response = HttpResponse(content_type=content_type)
+            response["X-Accel-Redirect"] = f"{accel_prefix}{relative_path}"
+            response["Content-Disposition"] = content_disposition_header(
+                False, filename
             )
+        else:
+            # nginx answers Range requests itself; without it, honour a
+            # single byte range so players can seek without a full download
+            response = None
+            range_header = request.META.get("HTTP_RANGE")
+            if range_header:
+                response = self._partial_response(
+                    file_handle, range_header, content_type
+                )
+            if response is None:
+                # Serve the file; FileResponse sets Content-Length from the
+                # open handle itself
+                response = FileResponse(
+                    file_handle, content_type=content_type, filename=filename
+                )
+            response["Accept-Ranges"] = "bytes"
+
+        patch_cache_control(
+            response, public=True, max_age=AUDIO_MAX_AGE, immutable=True
+        )
+        return response
 
 
 class ExerciseInstructionsView(APIView):
     """Get exercise instructions."""
 
+    error_message = "Failed to get instructions"
+
     def get(self, request, exercise_id):
         """Get instructions for an exercise."""
-        try:
-            exercise_class = exercise_registry.get_exercise(exercise_id)
-            if not exercise_class:
-                return Response(
-                    {
-                        "error": "not_found",
-                        "message": f"Exercise {exercise_id} not found",
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            exercise = exercise_class()
-            instructions = exercise.get_instructions()
-            hints = exercise.get_hints()
-
-            return Response({"instructions": instructions, "hints": hints})
-
-        except Exception as e:
-            logger.error(f"Error getting instructions for exercise {exercise_id}: {e}")
+        instructions_json = exercise_registry.get_instructions_json(exercise_id)
+        if instructions_json is None:
             return Response(
-                {"error": "internal_error", "message": "Failed to get instructions"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {
+                    "error": "not_found",
+                    "message": f"Exercise {exercise_id} not found",
+                },
+                status=status.HTTP_404_NOT_FOUND,
             )
+
+        return cached_json_response(
+            request,
+            instructions_json,
+            exercise_registry.get_instructions_etag(exercise_id),
+            exercise_registry.get_instructions_json_gz(exercise_id),
+        )
@@ -5,13 +5,77 @@ Audio synthesis using FluidSynth for generating WAV files from MIDI.
 import hashlib
 import logging
 import os
+import shutil
 import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
 
+# Note mapping (C=0, C#=1, D=2, etc.)
+NOTE_SEMITONES = {
+    "C": 0,
+    "C#": 1,
+    "Db": 1,
+    "D": 2,
+    "D#": 3,
+    "Eb": 3,
+    "E": 4,
+    "F": 5,
+    "F#": 6,
+    "Gb": 6,
+    "G": 7,
+    "G#": 8,
+    "Ab": 8,
+    "A": 9,
+    "A#": 10,
+    "Bb": 10,
+    "B": 11,
+}
+
+
+def _build_note_table() -> dict[str, tuple[int, float]]:
+    """
+    Precompute MIDI numbers and frequencies for every note name.
+
+    Returns:
+        dict: Note string (e.g. "C-4", "Bb-2", or "C" for octave 4) to a
+        (MIDI note number, frequency in Hz) pair
+    """
+    table = {}
+    for octave in range(10):
+        for name, semitones in NOTE_SEMITONES.items():
+            midi_number = (octave + 1) * 12 + semitones
+            # A4 = 440 Hz is MIDI note 69
+            frequency = 440.0 * (2 ** ((midi_number - 69) / 12.0))
+            table[f"{name}-{octave}"] = (midi_number, frequency)
+            if octave == 4:
+                table[name] = (midi_number, frequency)
+    return table
+
+
+NOTE_TABLE = _build_note_table()
+
+# Values accepted as "type" by AudioSynthesizer.synthesize_batch
+BATCH_SYNTHESIS_TYPES = frozenset(
+    {
+        "notes",
+        "chord",
+        "interval",
+        "melodic_interval",
+        "harmonic_interval",
+        "staggered_interval",
+        "progression",
+    }
+)
+
 
 class AudioSynthesizer:
     """
@@ -19,8 +83,23 @@ class AudioSynthesizer:
 
     This class handles the synthesis of audio files from MIDI data
     using FluidSynth and SoundFont files.
+
+    Paths returned from the audio cache always point at complete files:
+    cache entries are rendered, or copied from the caller's output_path,
+    under a temporary name and renamed into place, and never change
+    afterwards. They can be opened and streamed (e.g. with FileResponse
+    and sendfile) without further checks.
     """
 
+    # Recently served cache files, shared by every instance: path -> WAV bytes
+    _memory_cache: OrderedDict[str, bytes] = OrderedDict()
+    _memory_cache_size = 0
+    _memory_cache_lock = threading.Lock()
+
+    # FluidSynth instances shared by every instance: SoundFont path -> Synth
+    _fluidsynths: dict = {}
+    _fluidsynth_lock = threading.Lock()
+
     def __init__(self, soundfont_path: str | None = None):
         """
         Initialize the audio synthesizer.
@@ -34,6 +113,15 @@ class AudioSynthesizer:
         self.cache_enabled = getattr(settings, "AUDIO_CACHE_ENABLED", True)
         self.cache_max_size = getattr(settings, "AUDIO_CACHE_MAX_SIZE", 1000)
 
+        # Resolve the media and cache directories once so cache probes only
+        # cost a stat and URL building a prefix check
+        self.media_root = str(settings.MEDIA_ROOT)
+        # With a trailing separator so sibling directories never match
+        self.media_prefix = self.media_root.rstrip(os.sep) + os.sep
+        self.cache_dir = os.path.join(self.media_root, "audio", "cache")
+        if self.cache_enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
         # Resolve relative path to absolute path
         if self.soundfont_path and not os.path.isabs(self.soundfont_path):
             # If it's a relative path, make it relative to the backend directory
@@ -52,9 +140,9 @@ class AudioSynthesizer:
             content: String representation of the audio content
 
         Returns:
-            str: MD5 hash of the content
+            str: 128-bit BLAKE2b hash of the content, as 32 hex characters
         """
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> str:
         """
@@ -66,9 +154,7 @@ class AudioSynthesizer:
         Returns:
             str: Full path to the cached audio file
         """
-        cache_dir = os.path.join(settings.MEDIA_ROOT, "audio", "cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        return os.path.join(cache_dir, f"{cache_key}.wav")
+        return os.path.join(self.cache_dir, f"{cache_key}.wav")
 
     def _is_cached(self, cache_key: str) -> bool:
         """
@@ -113,51 +199,79 @@ class AudioSynthesizer:
             return audio_path
 
         cache_path = self._get_cache_path(cache_key)
-        cache_dir = os.path.dirname(cache_path)
-        os.makedirs(cache_dir, exist_ok=True)
-
-        # Copy the file to cache
-        import shutil
-
-        shutil.copy2(audio_path, cache_path)
+        # The directory may have been cleared since __init__
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Copy into a private temporary file and rename it into place: the
+        # entry never shares data with audio_path, which callers may write
+        # to again, and readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(audio_path, tmp_path)
+            Path(tmp_path).replace(cache_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
         return cache_path
 
-    def synthesize_notes(
-        self, notes: list[str], duration: float = 2.0, output_path: str | None = None
+    def _synthesize_cached(
+        self,
+        content: str,
+        prefix: str,
+        output_path: str | None,
+        create_wav: Callable[[str], None],
     ) -> str:
         """
-        Synthesize audio from a list of notes.
+        Return cached audio or render it, writing straight into the cache.
+
+        Every synthesize_* method goes through here, so cache lookups and
+        file handling live in one place.
 
         Args:
-            notes: List of note strings
-            duration: Duration of each note in seconds
+            content: String representation of the audio content
+            prefix: Filename prefix for uncached files
             output_path: Output file path (optional)
+            create_wav: Function writing the WAV data to the path it is given
 
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
-        content = f"notes:{','.join(notes)}:duration:{duration}"
         cache_key = self._generate_cache_key(content)
 
         # Check cache first
         if self._is_cached(cache_key):
             return self._get_cached_audio(cache_key)
 
-        # Generate audio file
+        if output_path is None and self.cache_enabled:
+            # The directory may have been cleared since __init__
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Write under a unique temporary name, then rename it into place:
+            # readers never see a partial file and concurrent renders of the
+            # same audio each replace the entry with complete data
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            os.close(fd)
+            try:
+                create_wav(tmp_path)
+                cache_path = self._get_cache_path(cache_key)
+                Path(tmp_path).replace(cache_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            return cache_path
+
         if output_path is None:
             # Create file in media directory instead of temp directory
             media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
             os.makedirs(media_dir, exist_ok=True)
             fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="notes_", dir=media_dir
+                suffix=".wav", prefix=prefix, dir=media_dir
             )
             os.close(fd)
 
-        # For now, create a placeholder WAV file
-        # In a full implementation, you'd use FluidSynth here
-        self._create_placeholder_wav(output_path, duration)
+        create_wav(output_path)
 
         # Cache the result
         if self.cache_enabled:
@@ -165,6 +279,78 @@ class AudioSynthesizer:
 
         return output_path
 
+    @classmethod
+    def get_cached_bytes(cls, cache_path: str) -> bytes | None:
+        """
+        Get the contents of a cached audio file, keeping hot files in memory.
+
+        Cache files are named after their synthesis parameters, so a path
+        always holds the same bytes and entries never need invalidating. The
+        least recently used entries are evicted beyond AUDIO_MEM_CACHE_BYTES.
+
+        Args:
+            cache_path: Path to a file in the audio cache directory
+
+        Returns:
+            bytes | None: File contents, or None if the file does not exist
+        """
+        with cls._memory_cache_lock:
+            data = cls._memory_cache.get(cache_path)
+            if data is not None:
+                cls._memory_cache.move_to_end(cache_path)
+                return data
+
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+        max_bytes = getattr(settings, "AUDIO_MEM_CACHE_BYTES", 64 * 1024 * 1024)
+        if len(data) <= max_bytes:
+            with cls._memory_cache_lock:
+                if cache_path not in cls._memory_cache:
+                    cls._memory_cache[cache_path] = data
+                    cls._memory_cache_size += len(data)
+                while cls._memory_cache_size > max_bytes:
+                    _, evicted = cls._memory_cache.popitem(last=False)
+                    cls._memory_cache_size -= len(evicted)
+
+        return data
+
+    @classmethod
+    def clear_memory_cache(cls):
+        """Forget every cache file held in memory by get_cached_bytes."""
+        with cls._memory_cache_lock:
+            cls._memory_cache.clear()
+            cls._memory_cache_size = 0
+
+    def synthesize_notes(
+        self, notes: list[str], duration: float = 2.0, output_path: str | None = None
+    ) -> str:
+        """
+        Synthesize audio from a list of notes.
+
+        Args:
+            notes: List of note strings
+            duration: Duration of each note in seconds
+            output_path: Output file path (optional)
+
+        Returns:
+            str: Path to the generated audio file
+        """
+        # Describe the audio for its cache key
+        content = f"notes:{','.join(notes)}:duration:{duration}"
+
+        # For now, create a placeholder WAV file
+        # In a full implementation, you'd use FluidSynth here
+        return self._synthesize_cached(
+            content,
+            "notes_",
+            output_path,
+            lambda path: self._create_placeholder_wav(path, duration),
+        )
+
     def synthesize_chord(
         self,
         chord_notes: list[str],
@@ -182,32 +368,16 @@ class AudioSynthesizer:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
+        # Describe the audio for its cache key
         content = f"chord:{','.join(chord_notes)}:duration:{duration}"
-        cache_key = self._generate_cache_key(content)
-
-        # Check cache first
-        if self._is_cached(cache_key):
-            return self._get_cached_audio(cache_key)
-
-        # Generate audio file
-        if output_path is None:
-            # Create file in media directory instead of temp directory
-            media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
-            os.makedirs(media_dir, exist_ok=True)
-            fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="chord_", dir=media_dir
-            )
-            os.close(fd)
 
         # Create placeholder WAV file
-        self._create_placeholder_wav(output_path, duration)
-
-        # Cache the result
-        if self.cache_enabled:
-            output_path = self._cache_audio(cache_key, output_path)
-
-        return output_path
+        return self._synthesize_cached(
+            content,
+            "chord_",
+            output_path,
+            lambda path: self._create_placeholder_wav(path, duration),
+        )
 
     def synthesize_interval(
         self,
@@ -251,35 +421,19 @@ class AudioSynthesizer:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
+        # Describe the audio for its cache key
         content = f"melodic_interval:{note1}:{note2}:duration:{note_duration}:gap:{gap_duration}"
-        cache_key = self._generate_cache_key(content)
-
-        # Check cache first
-        if self._is_cached(cache_key):
-            return self._get_cached_audio(cache_key)
-
-        # Generate audio file
-        if output_path is None:
-            # Create file in media directory instead of temp directory
-            media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
-            os.makedirs(media_dir, exist_ok=True)
-            fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="melodic_interval_", dir=media_dir
-            )
-            os.close(fd)
 
         # Create melodic interval WAV file
-        self._create_melodic_interval_wav(
-            output_path, note1, note2, note_duration, gap_duration
+        return self._synthesize_cached(
+            content,
+            "melodic_interval_",
+            output_path,
+            lambda path: self._create_melodic_interval_wav(
+                path, note1, note2, note_duration, gap_duration
+            ),
         )
 
-        # Cache the result
-        if self.cache_enabled:
-            output_path = self._cache_audio(cache_key, output_path)
-
-        return output_path
-
     def synthesize_harmonic_interval(
         self,
         note1: str,
@@ -299,32 +453,18 @@ class AudioSynthesizer:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
+        # Describe the audio for its cache key
         content = f"harmonic_interval:{note1}:{note2}:duration:{duration}"
-        cache_key = self._generate_cache_key(content)
-
-        # Check cache first
-        if self._is_cached(cache_key):
-            return self._get_cached_audio(cache_key)
-
-        # Generate audio file
-        if output_path is None:
-            # Create file in media directory instead of temp directory
-            media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
-            os.makedirs(media_dir, exist_ok=True)
-            fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="harmonic_interval_", dir=media_dir
-            )
-            os.close(fd)
 
         # Create harmonic interval WAV file
-        self._create_harmonic_interval_wav(output_path, note1, note2, duration)
-
-        # Cache the result
-        if self.cache_enabled:
-            output_path = self._cache_audio(cache_key, output_path)
-
-        return output_path
+        return self._synthesize_cached(
+            content,
+            "harmonic_interval_",
+            output_path,
+            lambda path: self._create_harmonic_interval_wav(
+                path, note1, note2, duration
+            ),
+        )
 
     def synthesize_staggered_interval(
         self,
@@ -349,35 +489,19 @@ class AudioSynthesizer:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
+        # Describe the audio for its cache key
         content = f"staggered_interval:{note1}:{note2}:root:{root_duration}:second:{second_duration}:delay:{delay_ms}"
-        cache_key = self._generate_cache_key(content)
-
-        # Check cache first
-        if self._is_cached(cache_key):
-            return self._get_cached_audio(cache_key)
-
-        # Generate audio file
-        if output_path is None:
-            # Create file in media directory instead of temp directory
-            media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
-            os.makedirs(media_dir, exist_ok=True)
-            fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="staggered_interval_", dir=media_dir
-            )
-            os.close(fd)
 
         # Create staggered interval WAV file
-        self._create_staggered_interval_wav(
-            output_path, note1, note2, root_duration, second_duration, delay_ms
+        return self._synthesize_cached(
+            content,
+            "staggered_interval_",
+            output_path,
+            lambda path: self._create_staggered_interval_wav(
+                path, note1, note2, root_duration, second_duration, delay_ms
+            ),
         )
 
-        # Cache the result
-        if self.cache_enabled:
-            output_path = self._cache_audio(cache_key, output_path)
-
-        return output_path
-
     def synthesize_progression(
         self,
         progression: list[list[str]],
@@ -395,35 +519,47 @@ class AudioSynthesizer:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate cache key
-        content = f"progression:{len(progression)}:duration:{chord_duration}"
-        cache_key = self._generate_cache_key(content)
-
-        # Check cache first
-        if self._is_cached(cache_key):
-            return self._get_cached_audio(cache_key)
-
-        # Generate audio file
-        if output_path is None:
-            # Create file in media directory instead of temp directory
-            media_dir = os.path.join(settings.MEDIA_ROOT, "audio")
-            os.makedirs(media_dir, exist_ok=True)
-            fd, output_path = tempfile.mkstemp(
-                suffix=".wav", prefix="progression_", dir=media_dir
-            )
-            os.close(fd)
+        # Describe the audio for its cache key
+        chords = "|".join(",".join(chord) for chord in progression)
+        content = f"progression:{chords}:duration:{chord_duration}"
 
         # Calculate total duration
         total_duration = len(progression) * chord_duration
 
         # Create placeholder WAV file
-        self._create_placeholder_wav(output_path, total_duration)
+        return self._synthesize_cached(
+            content,
+            "progression_",
+            output_path,
+            lambda path: self._create_placeholder_wav(path, total_duration),
+        )
 
-        # Cache the result
-        if self.cache_enabled:
-            output_path = self._cache_audio(cache_key, output_path)
+    def synthesize_batch(self, requests: list[dict]) -> list[str]:
+        """
+        Synthesize several audio files in one go, e.g. to pre-warm the cache.
 
-        return output_path
+        Cached files are returned directly and misses are rendered in turn,
+        reusing the already loaded FluidSynth instance.
+
+        Args:
+            requests: Synthesis requests, each with a "type" key naming a
+                synthesize_* method (e.g. "harmonic_interval") and that
+                method's keyword arguments
+
+        Returns:
+            list[str]: Paths to the generated audio files, in request order
+
+        Raises:
+            ValueError: If a request names an unknown synthesis type
+        """
+        paths = []
+        for request in requests:
+            params = dict(request)
+            synthesis_type = params.pop("type", None)
+            if synthesis_type not in BATCH_SYNTHESIS_TYPES:
+                raise ValueError(f"Unknown synthesis type: {synthesis_type}")
+            paths.append(getattr(self, f"synthesize_{synthesis_type}")(**params))
+        return paths
 
     def _create_placeholder_wav(self, output_path: str, duration: float):
         """
@@ -436,8 +572,6 @@ class AudioSynthesizer:
             output_path: Path where to save the WAV file
             duration: Duration of the audio in seconds
         """
-        import wave
-
         import numpy as np
 
         # Audio parameters
@@ -450,17 +584,57 @@ class AudioSynthesizer:
         audio_data = np.sin(2 * np.pi * frequency * t)
 
         # Convert to 16-bit integers
-        audio_data = (audio_data * 32767).astype(np.int16)
+        audio_data = self._to_pcm16(audio_data)
 
         # Write WAV file
-        with wave.open(output_path, "w") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created placeholder WAV file: {output_path}")
 
+    def _get_fluidsynth(self):
+        """
+        Get the shared FluidSynth instance for this synthesizer's SoundFont.
+
+        Starting FluidSynth and loading a SoundFont costs far more than
+        rendering a short interval, so each SoundFont is loaded once per
+        process. Callers must hold _fluidsynth_lock while using the instance.
+
+        Returns:
+            fluidsynth.Synth: Synth with the piano program selected on channel 0
+        """
+        fs = self._fluidsynths.get(self.soundfont_path)
+        if fs is None:
+            import fluidsynth
+
+            # Initialize FluidSynth. No audio driver is started: samples are
+            # pulled with get_samples, which renders as fast as the CPU allows.
+            fs = fluidsynth.Synth()
+
+            # Load SoundFont
+            sfid = fs.sfload(self.soundfont_path)
+            fs.program_select(0, sfid, 0, 0)  # Use piano (program 0)
+            self._fluidsynths[self.soundfont_path] = fs
+        else:
+            # Cut release tails left over from the previous render
+            fs.cc(0, 120, 0)  # All Sound Off
+        return fs
+
+    @staticmethod
+    def _fluidsynth_mono(samples):
+        """
+        Downmix samples rendered by FluidSynth to mono.
+
+        Args:
+            samples: Interleaved stereo int16 samples from Synth.get_samples
+
+        Returns:
+            np.ndarray: Mono int16 samples
+        """
+        import numpy as np
+
+        stereo = np.asarray(samples, dtype=np.int32).reshape(-1, 2)
+        return (stereo.sum(axis=1) // 2).astype(np.int16)
+
     def _create_melodic_interval_wav(
         self,
         output_path: str,
@@ -513,57 +687,38 @@ class AudioSynthesizer:
         gap_duration: float,
     ):
         """Create interval using FluidSynth with real piano sounds."""
-        import wave
-
-        import fluidsynth
         import numpy as np
 
-        # Initialize FluidSynth
-        fs = fluidsynth.Synth()
-        fs.start()  # Start without file driver
-
-        # Load SoundFont
-        sfid = fs.sfload(self.soundfont_path)
-        fs.program_select(0, sfid, 0, 0)  # Use piano (program 0)
-
         # Convert notes to MIDI numbers
         midi1 = self._note_to_midi_number(note1)
         midi2 = self._note_to_midi_number(note2)
 
         # Calculate sample rate
         sample_rate = 44100
-
-        # Generate samples
-        samples = []
-
-        # Play first note
-        fs.noteon(0, midi1, 100)
         note_samples = int(note_duration * sample_rate)
-        samples.extend(fs.get_samples(note_samples))
-        fs.noteoff(0, midi1)
-
-        # Add gap
         gap_samples = int(gap_duration * sample_rate)
-        samples.extend([0] * gap_samples)
 
-        # Play second note
-        fs.noteon(0, midi2, 100)
-        note_samples = int(note_duration * sample_rate)
-        samples.extend(fs.get_samples(note_samples))
-        fs.noteoff(0, midi2)
+        # Render into a silent buffer: note1 + gap + note2
+        audio_data = np.zeros(2 * note_samples + gap_samples, dtype=np.int16)
+        with self._fluidsynth_lock:
+            fs = self._get_fluidsynth()
 
-        # Convert to numpy array and save as WAV
-        audio_data = np.array(samples, dtype=np.int16)
+            # Play first note
+            fs.noteon(0, midi1, 100)
+            audio_data[:note_samples] = self._fluidsynth_mono(
+                fs.get_samples(note_samples)
+            )
+            fs.noteoff(0, midi1)
 
-        # Save as WAV file
-        with wave.open(output_path, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+            # Play second note after the gap
+            fs.noteon(0, midi2, 100)
+            audio_data[note_samples + gap_samples :] = self._fluidsynth_mono(
+                fs.get_samples(note_samples)
+            )
+            fs.noteoff(0, midi2)
 
-        # Clean up
-        fs.delete()
+        # Save as WAV file
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created FluidSynth melodic interval WAV file: {output_path}")
 
@@ -576,8 +731,6 @@ class AudioSynthesizer:
         gap_duration: float,
     ):
         """Create interval using synthetic piano sounds (fallback)."""
-        import wave
-
         import numpy as np
 
         # Audio parameters
@@ -589,29 +742,21 @@ class AudioSynthesizer:
         freq1 = self._note_to_frequency(note1)
         freq2 = self._note_to_frequency(note2)
 
-        # Generate time arrays
-        t1 = np.linspace(0, note_duration, note_samples, False)
-        t2 = np.linspace(0, note_duration, note_samples, False)
-
         # Generate audio for each note with piano-like envelope
-        audio1 = self._generate_piano_tone(freq1, t1)
-        audio2 = self._generate_piano_tone(freq2, t2)
+        audio1 = self._generate_piano_tone(freq1, note_samples, sample_rate)
+        audio2 = self._generate_piano_tone(freq2, note_samples, sample_rate)
 
         # Create silence for the gap
-        silence = np.zeros(gap_samples)
+        silence = np.zeros(gap_samples, dtype=np.float32)
 
         # Combine: note1 + silence + note2
         combined_audio = np.concatenate([audio1, silence, audio2])
 
         # Convert to 16-bit integers
-        audio_data = (combined_audio * 32767).astype(np.int16)
+        audio_data = self._to_pcm16(combined_audio)
 
         # Write WAV file
-        with wave.open(output_path, "w") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created synthetic melodic interval WAV file: {output_path}")
 
@@ -656,19 +801,6 @@ class AudioSynthesizer:
         self, output_path: str, note1: str, note2: str, duration: float
     ):
         """Create harmonic interval using FluidSynth with real piano sounds."""
-        import wave
-
-        import fluidsynth
-        import numpy as np
-
-        # Initialize FluidSynth
-        fs = fluidsynth.Synth()
-        fs.start()  # Start without file driver
-
-        # Load SoundFont
-        sfid = fs.sfload(self.soundfont_path)
-        fs.program_select(0, sfid, 0, 0)  # Use piano (program 0)
-
         # Convert notes to MIDI numbers
         midi1 = self._note_to_midi_number(note1)
         midi2 = self._note_to_midi_number(note2)
@@ -678,24 +810,16 @@ class AudioSynthesizer:
         note_samples = int(duration * sample_rate)
 
         # Play both notes simultaneously
-        fs.noteon(0, midi1, 100)
-        fs.noteon(0, midi2, 100)
-        samples = fs.get_samples(note_samples)
-        fs.noteoff(0, midi1)
-        fs.noteoff(0, midi2)
-
-        # Convert to numpy array and save as WAV
-        audio_data = np.array(samples, dtype=np.int16)
+        with self._fluidsynth_lock:
+            fs = self._get_fluidsynth()
+            fs.noteon(0, midi1, 100)
+            fs.noteon(0, midi2, 100)
+            audio_data = self._fluidsynth_mono(fs.get_samples(note_samples))
+            fs.noteoff(0, midi1)
+            fs.noteoff(0, midi2)
 
         # Save as WAV file
-        with wave.open(output_path, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
-
-        # Clean up
-        fs.delete()
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created FluidSynth harmonic interval WAV file: {output_path}")
 
@@ -703,10 +827,6 @@ class AudioSynthesizer:
         self, output_path: str, note1: str, note2: str, duration: float
     ):
         """Create harmonic interval using synthetic piano sounds (fallback)."""
-        import wave
-
-        import numpy as np
-
         # Audio parameters
         sample_rate = 44100
         total_samples = int(sample_rate * duration)
@@ -715,25 +835,19 @@ class AudioSynthesizer:
         freq1 = self._note_to_frequency(note1)
         freq2 = self._note_to_frequency(note2)
 
-        # Generate time array
-        t = np.linspace(0, duration, total_samples, False)
-
         # Generate audio for both notes
-        audio1 = self._generate_piano_tone(freq1, t)
-        audio2 = self._generate_piano_tone(freq2, t)
+        audio1 = self._generate_piano_tone(freq1, total_samples, sample_rate)
+        audio2 = self._generate_piano_tone(freq2, total_samples, sample_rate)
 
-        # Mix both notes together
-        combined_audio = (audio1 + audio2) / 2  # Average to prevent clipping
+        # Mix both notes together, averaging to prevent clipping
+        combined_audio = audio1 + audio2
+        combined_audio *= 0.5
 
         # Convert to 16-bit integers
-        audio_data = (combined_audio * 32767).astype(np.int16)
+        audio_data = self._to_pcm16(combined_audio)
 
         # Write WAV file
-        with wave.open(output_path, "w") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created synthetic harmonic interval WAV file: {output_path}")
 
@@ -802,19 +916,8 @@ class AudioSynthesizer:
         delay_ms: int,
     ):
         """Create staggered interval using FluidSynth with real piano sounds."""
-        import wave
-
-        import fluidsynth
         import numpy as np
 
-        # Initialize FluidSynth
-        fs = fluidsynth.Synth()
-        fs.start()  # Start without file driver
-
-        # Load SoundFont
-        sfid = fs.sfload(self.soundfont_path)
-        fs.program_select(0, sfid, 0, 0)  # Use piano (program 0)
-
         # Convert notes to MIDI numbers
         midi1 = self._note_to_midi_number(note1)
         midi2 = self._note_to_midi_number(note2)
@@ -822,38 +925,32 @@ class AudioSynthesizer:
         # Calculate timing
         sample_rate = 44100
         delay_seconds = delay_ms / 1000.0
-
-        # Generate samples
-        samples = []
-
-        # Play root note first
-        fs.noteon(0, midi1, 100)
         root_samples = int(root_duration * sample_rate)
-        samples.extend(fs.get_samples(root_samples))
-        fs.noteoff(0, midi1)
-
-        # Add delay before second note
         delay_samples = int(delay_seconds * sample_rate)
-        samples.extend([0] * delay_samples)
-
-        # Play second note
-        fs.noteon(0, midi2, 100)
         second_samples = int(second_duration * sample_rate)
-        samples.extend(fs.get_samples(second_samples))
-        fs.noteoff(0, midi2)
 
-        # Convert to numpy array and save as WAV
-        audio_data = np.array(samples, dtype=np.int16)
+        # Render into a silent buffer: root note + delay + second note
+        second_start = root_samples + delay_samples
+        audio_data = np.zeros(second_start + second_samples, dtype=np.int16)
+        with self._fluidsynth_lock:
+            fs = self._get_fluidsynth()
 
-        # Save as WAV file
-        with wave.open(output_path, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+            # Play root note first
+            fs.noteon(0, midi1, 100)
+            audio_data[:root_samples] = self._fluidsynth_mono(
+                fs.get_samples(root_samples)
+            )
+            fs.noteoff(0, midi1)
 
-        # Clean up
-        fs.delete()
+            # Play second note after the delay
+            fs.noteon(0, midi2, 100)
+            audio_data[second_start:] = self._fluidsynth_mono(
+                fs.get_samples(second_samples)
+            )
+            fs.noteoff(0, midi2)
+
+        # Save as WAV file
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created FluidSynth staggered interval WAV file: {output_path}")
 
@@ -867,8 +964,6 @@ class AudioSynthesizer:
         delay_ms: int,
     ):
         """Create staggered interval using synthetic piano sounds (fallback)."""
-        import wave
-
         import numpy as np
 
         # Audio parameters
@@ -883,37 +978,34 @@ class AudioSynthesizer:
         freq1 = self._note_to_frequency(note1)
         freq2 = self._note_to_frequency(note2)
 
-        # Generate time arrays
-        t1 = np.linspace(0, root_duration, int(sample_rate * root_duration), False)
-        t2 = np.linspace(0, second_duration, int(sample_rate * second_duration), False)
-
         # Generate audio for each note with piano-like envelope
-        audio1 = self._generate_piano_tone(freq1, t1)
-        audio2 = self._generate_piano_tone(freq2, t2)
+        audio1 = self._generate_piano_tone(
+            freq1, int(sample_rate * root_duration), sample_rate
+        )
+        audio2 = self._generate_piano_tone(
+            freq2, int(sample_rate * second_duration), sample_rate
+        )
 
-        # Create the combined audio array
-        combined_audio = np.zeros(total_samples)
+        # Create the combined audio array; only the part after the root note
+        # needs clearing
+        combined_audio = np.empty(total_samples, dtype=np.float32)
 
         # Add root note at the beginning
-        root_samples = len(audio1)
-        combined_audio[:root_samples] = audio1
+        root_samples = min(len(audio1), total_samples)
+        combined_audio[:root_samples] = audio1[:root_samples]
+        combined_audio[root_samples:] = 0
 
-        # Add second note after delay
+        # Add second note after delay, trimming any rounding overhang
         delay_samples = int(sample_rate * delay_seconds)
         second_start = delay_samples
-        second_end = second_start + len(audio2)
-        if second_end <= total_samples:
-            combined_audio[second_start:second_end] += audio2
+        second_end = min(second_start + len(audio2), total_samples)
+        combined_audio[second_start:second_end] += audio2[: second_end - second_start]
 
-        # Convert to 16-bit integers
-        audio_data = (combined_audio * 32767).astype(np.int16)
+        # Convert to 16-bit integers; the overlap can exceed full scale
+        audio_data = self._to_pcm16(combined_audio)
 
         # Write WAV file
-        with wave.open(output_path, "w") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        self._write_wav(output_path, audio_data, sample_rate)
 
         logger.info(f"Created synthetic staggered interval WAV file: {output_path}")
 
@@ -927,6 +1019,10 @@ class AudioSynthesizer:
         Returns:
             int: MIDI note number (0-127)
         """
+        entry = NOTE_TABLE.get(note)
+        if entry is not None:
+            return entry[0]
+
         # Parse note and octave
         if "-" in note:
             base_note, octave_str = note.split("-")
@@ -935,29 +1031,8 @@ class AudioSynthesizer:
             base_note = note
             octave = 4  # Default octave
 
-        # Note mapping (C=0, C#=1, D=2, etc.)
-        note_map = {
-            "C": 0,
-            "C#": 1,
-            "Db": 1,
-            "D": 2,
-            "D#": 3,
-            "Eb": 3,
-            "E": 4,
-            "F": 5,
-            "F#": 6,
-            "Gb": 6,
-            "G": 7,
-            "G#": 8,
-            "Ab": 8,
-            "A": 9,
-            "A#": 10,
-            "Bb": 10,
-            "B": 11,
-        }
-
         # Calculate MIDI number
-        note_semitones = note_map.get(base_note, 0)
+        note_semitones = NOTE_SEMITONES.get(base_note, 0)
         midi_number = (octave + 1) * 12 + note_semitones
 
         return midi_number
@@ -972,30 +1047,13 @@ class AudioSynthesizer:
         Returns:
             float: Frequency in Hz
         """
+        entry = NOTE_TABLE.get(note)
+        if entry is not None:
+            return entry[1]
+
         # A4 = 440 Hz
         a4_freq = 440.0
 
-        # Note mapping (C=0, C#=1, D=2, etc.)
-        note_map = {
-            "C": 0,
-            "C#": 1,
-            "Db": 1,
-            "D": 2,
-            "D#": 3,
-            "Eb": 3,
-            "E": 4,
-            "F": 5,
-            "F#": 6,
-            "Gb": 6,
-            "G": 7,
-            "G#": 8,
-            "Ab": 8,
-            "A": 9,
-            "A#": 10,
-            "Bb": 10,
-            "B": 11,
-        }
-
         # Parse note and octave
         if "-" in note:
             note_name, octave_str = note.split("-")
@@ -1005,7 +1063,7 @@ class AudioSynthesizer:
             octave = 4  # Default octave
 
         # Calculate semitones from A4
-        note_semitones = note_map.get(note_name, 9)  # Default to A
+        note_semitones = NOTE_SEMITONES.get(note_name, 9)  # Default to A
         octave_semitones = (octave - 4) * 12
         total_semitones = note_semitones + octave_semitones - 9  # A4 is reference
 
@@ -1014,36 +1072,130 @@ class AudioSynthesizer:
 
         return frequency
 
-    def _generate_piano_tone(self, frequency: float, time_array):
+    @staticmethod
+    def _to_pcm16(audio):
+        """
+        Convert float samples in [-1, 1] to 16-bit integers.
+
+        Scaling and clipping happen in place, and samples beyond full scale
+        saturate instead of wrapping around to the opposite sign.
+
+        Args:
+            audio: Float sample array owned by the caller; it is overwritten
+
+        Returns:
+            np.ndarray: int16 samples
+        """
+        import numpy as np
+
+        audio *= 32767
+        np.clip(audio, -32768, 32767, out=audio)
+        return audio.astype(np.int16)
+
+    def _write_wav(self, output_path: str, audio_data, sample_rate: int = 44100):
+        """
+        Write mono 16-bit samples to a WAV file.
+
+        The frame count is set before writing, so the header goes out once
+        with its final sizes and the samples are passed to the wave module
+        as a buffer instead of being copied into a bytes object first.
+
+        Args:
+            output_path: Path where to save the WAV file
+            audio_data: C-contiguous int16 numpy array of samples
+            sample_rate: Sample rate in Hz
+        """
+        import wave
+
+        with wave.open(output_path, "wb") as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(sample_rate)
+            wav_file.setnframes(len(audio_data))
+            wav_file.writeframesraw(memoryview(audio_data).cast("B"))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _piano_envelope(num_samples: int, sample_rate: int = 44100):
+        """
+        Build the piano-like envelope exp(-3t) * (1 - exp(-20t)).
+
+        The envelope only depends on the tone length, so it is shared by
+        every note of the same duration.
+
+        Args:
+            num_samples: Length of the envelope in samples
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            np.ndarray: Read-only float32 envelope
+        """
+        import numpy as np
+
+        t = np.arange(num_samples, dtype=np.float32)
+        t *= np.float32(-1.0 / sample_rate)
+        attack = np.multiply(t, 20)
+        np.exp(attack, out=attack)
+        np.subtract(1, attack, out=attack)
+        t *= 3
+        np.exp(t, out=t)
+        t *= attack
+
+        t.flags.writeable = False
+        return t
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_piano_tone(
+        frequency: float, num_samples: int, sample_rate: int = 44100
+    ):
         """
         Generate a piano-like tone with attack and decay envelope.
 
+        Exercises keep reusing the same few dozen notes and durations, so
+        rendered tones are cached and shared between calls.
+
         Args:
             frequency: Frequency in Hz
-            time_array: Time array for the note
+            num_samples: Length of the tone in samples
+            sample_rate: Sample rate in Hz
 
         Returns:
-            np.ndarray: Audio samples
+            np.ndarray: Read-only float32 audio samples
         """
         import numpy as np
 
-        # Generate base sine wave
-        audio = np.sin(2 * np.pi * frequency * time_array)
-
-        # Add harmonics for piano-like sound
-        audio += 0.3 * np.sin(2 * np.pi * frequency * 2 * time_array)  # Octave
-        audio += 0.1 * np.sin(2 * np.pi * frequency * 3 * time_array)  # Fifth
+        # Phase advances by a fixed step per sample, so no time axis is needed.
+        # It stays float64 because float32 loses precision over long notes.
+        phase = np.arange(num_samples, dtype=np.float64)
+        phase *= 2 * np.pi * frequency / sample_rate
+
+        audio = np.empty(num_samples, dtype=np.float32)
+        partial = np.empty(num_samples, dtype=np.float32)
+        np.sin(phase, out=audio)
+        np.cos(phase, out=partial)
+
+        # Add harmonics for piano-like sound. They are derived from sin x and
+        # cos x instead of evaluating sin again at 2x and 3x:
+        # sin 2x = 2 sin x cos x and sin 3x = 3 sin x - 4 sin^3 x
+        partial *= audio
+        partial *= 0.6  # Octave: 0.3 * sin 2x
+        fifth = np.square(audio)
+        fifth *= -0.4
+        fifth += 0.3
+        fifth *= audio  # Fifth: 0.1 * sin 3x
+        audio += partial
+        audio += fifth
 
         # Apply piano-like envelope (quick attack, slow decay)
-        envelope = np.exp(-time_array * 3) * (1 - np.exp(-time_array * 20))
-
-        # Apply envelope
-        audio *= envelope
+        audio *= AudioSynthesizer._piano_envelope(num_samples, sample_rate)
 
         # Normalize
-        if np.max(np.abs(audio)) > 0:
-            audio = audio / np.max(np.abs(audio)) * 0.7
+        peak = max(audio.max(initial=0), -audio.min(initial=0))
+        if peak > 0:
+            audio *= np.float32(0.7 / peak)
 
+        audio.flags.writeable = False
         return audio
 
     def get_audio_url(self, audio_path: str) -> str:
@@ -1056,14 +1208,50 @@ class AudioSynthesizer:
         Returns:
             str: URL to access the audio file
         """
-        # Convert absolute path to relative path from MEDIA_ROOT
-        media_root_str = str(settings.MEDIA_ROOT)
-        if audio_path.startswith(media_root_str):
-            relative_path = os.path.relpath(audio_path, media_root_str)
-            filename = Path(relative_path).name
+        # Files under MEDIA_ROOT are served by name, wherever they live in it
+        if audio_path.startswith(self.media_prefix):
+            filename = audio_path.rpartition(os.sep)[2]
 
             # Use the API endpoint for serving audio files
             # This ensures proper CORS headers and works across domains
             return f"/api/audio/{filename}/"
 
         return audio_path
+
+
+# Settings read by AudioSynthesizer.__init__
+SYNTHESIZER_SETTINGS = frozenset(
+    {"MEDIA_ROOT", "SOUNDFONT_PATH", "AUDIO_CACHE_ENABLED", "AUDIO_CACHE_MAX_SIZE"}
+)
+
+_synthesizer: AudioSynthesizer | None = None
+_synthesizer_lock = threading.Lock()
+
+
+def get_synthesizer() -> AudioSynthesizer:
+    """
+    Get the audio synthesizer shared by the whole process.
+
+    A synthesizer only holds values derived from settings, so building one
+    per request would just repeat the same path checks (and SoundFont
+    warning) every time.
+
+    Returns:
+        AudioSynthesizer: Shared synthesizer for the current settings
+    """
+    global _synthesizer
+    synthesizer = _synthesizer
+    if synthesizer is None:
+        with _synthesizer_lock:
+            if _synthesizer is None:
+                _synthesizer = AudioSynthesizer()
+            synthesizer = _synthesizer
+    return synthesizer
+
+
+@receiver(setting_changed)
+def reset_synthesizer(*, setting, **kwargs):
+    """Drop the shared synthesizer when a setting it depends on changes."""
+    global _synthesizer
+    if setting in SYNTHESIZER_SETTINGS:
+        _synthesizer = None
@@ -45,6 +45,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "api_app.middleware.APIGZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -120,8 +121,9 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "api_app.renderers.ORJSONRenderer",
     ],
+    "EXCEPTION_HANDLER": "api_app.views.api_exception_handler",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
 }
@@ -137,6 +139,13 @@ CORS_ALLOW_CREDENTIALS = True
 SOUNDFONT_PATH = config("SOUNDFONT_PATH", default="../soundfonts/School_Piano_2024.sf2")
 AUDIO_CACHE_ENABLED = config("AUDIO_CACHE_ENABLED", default=True, cast=bool)
 AUDIO_CACHE_MAX_SIZE = config("AUDIO_CACHE_MAX_SIZE", default=1000, cast=int)
+# Memory budget for cached WAV files kept in RAM by each worker process
+AUDIO_MEM_CACHE_BYTES = config(
+    "AUDIO_MEM_CACHE_BYTES", default=64 * 1024 * 1024, cast=int
+)
+# Internal nginx location for audio files (e.g. "/protected_audio/"). When set,
+# AudioFileView returns an X-Accel-Redirect header instead of streaming the file.
+AUDIO_X_ACCEL_REDIRECT_PREFIX = config("AUDIO_X_ACCEL_REDIRECT_PREFIX", default="")
 
 # Logging
 LOGGING = {
@@ -20,6 +20,9 @@ class BaseExercise(ABC):
     # Each exercise must define its metadata
     metadata: ExerciseMetadata
 
+    # Configuration keys generate() understands; other request params are dropped
+    generate_params: frozenset[str] = frozenset({"key", "difficulty"})
+
     def __init__(self):
         """Initialize the exercise."""
         if not hasattr(self, "metadata"):
@@ -54,6 +57,21 @@ class BaseExercise(ABC):
         """
         pass
 
+    def is_deterministic(self, config: dict[str, Any]) -> bool:
+        """
+        Check whether generate() always returns the same data for a config.
+
+        Exercises that pick random content return False (the default), so
+        their generated data is never reused across requests.
+
+        Args:
+            config: Raw configuration from request
+
+        Returns:
+            bool: True if generate(**config) is deterministic
+        """
+        return False
+
     def get_instructions(self) -> str:
         """
         Get exercise instructions for the user.
@@ -13,6 +13,60 @@ from music_app.notes import transpose_note
 from exercises.base.exercise import BaseExercise
 from exercises.base.metadata import ExerciseData, ExerciseMetadata, ExerciseResult
 
+# Semitones spanned by each interval
+INTERVAL_SEMITONES = {
+    "unison": 0,
+    "minor_second": 1,
+    "major_second": 2,
+    "minor_third": 3,
+    "major_third": 4,
+    "perfect_fourth": 5,
+    "augmented_fourth": 6,
+    "diminished_fifth": 6,
+    "perfect_fifth": 7,
+    "minor_sixth": 8,
+    "major_sixth": 9,
+    "minor_seventh": 10,
+    "major_seventh": 11,
+    "octave": 12,
+}
+
+# Display name of each interval
+INTERVAL_DISPLAY_NAMES = {
+    "unison": "Unison",
+    "minor_second": "Minor Second",
+    "major_second": "Major Second",
+    "minor_third": "Minor Third",
+    "major_third": "Major Third",
+    "perfect_fourth": "Perfect Fourth",
+    "augmented_fourth": "Augmented Fourth",
+    "diminished_fifth": "Diminished Fifth",
+    "perfect_fifth": "Perfect Fifth",
+    "minor_sixth": "Minor Sixth",
+    "major_sixth": "Major Sixth",
+    "minor_seventh": "Minor Seventh",
+    "major_seventh": "Major Seventh",
+    "octave": "Octave",
+}
+
+# Answer notation of each interval (e.g. "3m", "3M", "4J", "5J", "8J")
+INTERVAL_NOTATIONS = {
+    "unison": "1J",
+    "minor_second": "2m",
+    "major_second": "2M",
+    "minor_third": "3m",
+    "major_third": "3M",
+    "perfect_fourth": "4J",
+    "augmented_fourth": "4+",
+    "diminished_fifth": "5°",
+    "perfect_fifth": "5J",
+    "minor_sixth": "6m",
+    "major_sixth": "6M",
+    "minor_seventh": "7m",
+    "major_seventh": "7M",
+    "octave": "8J",
+}
+
 
 class BaseIntervalExercise(BaseExercise):
     """
@@ -22,6 +76,10 @@ class BaseIntervalExercise(BaseExercise):
     different interval sets and timing (melodic vs harmonic).
     """
 
+    generate_params = frozenset(
+        {"reference_note", "interval", "question_number", "octave"}
+    )
+
     def __init__(self, intervals: list[str], exercise_type: str, timing: str):
         """
         Initialize the interval exercise.
@@ -36,6 +94,9 @@ class BaseIntervalExercise(BaseExercise):
         self.timing = timing
         self.is_melodic = timing == "melodic"
 
+        # Answer options are the same for every question
+        self.options = [self._get_interval_notation(interval) for interval in intervals]
+
         # Set up metadata
         self.metadata = self._create_metadata()
 
@@ -112,9 +173,9 @@ class BaseIntervalExercise(BaseExercise):
         second_note = self._get_interval_note(reference_note_with_octave, interval)
 
         # Generate audio files using the audio synthesizer
-        from audio_app.synthesizer import AudioSynthesizer
+        from audio_app.synthesizer import get_synthesizer
 
-        synthesizer = AudioSynthesizer()
+        synthesizer = get_synthesizer()
 
         # Generate interval audio based on timing type
         if self.is_melodic:
@@ -140,7 +201,7 @@ class BaseIntervalExercise(BaseExercise):
         total_questions = self.metadata.config_options.get("total_questions", 20)
 
         # Create options (all available intervals for this exercise)
-        options = [self._get_interval_notation(interval) for interval in self.intervals]
+        options = list(self.options)
 
         # Create context with exercise information
         context = {
@@ -192,6 +253,22 @@ class BaseIntervalExercise(BaseExercise):
             user_answer=answer,
         )
 
+    def is_deterministic(self, config: dict[str, Any]) -> bool:
+        """
+        Check whether generate() always returns the same data for a config.
+
+        The reference note and interval are picked at random unless both are
+        given, so only fully specified questions are deterministic.
+
+        Args:
+            config: Raw configuration from request
+
+        Returns:
+            bool: True if generate(**config) is deterministic
+        """
+        validated = self.validate_config(config)
+        return "reference_note" in validated and "interval" in validated
+
     def get_instructions(self) -> str:
         """Get exercise instructions."""
         timing_desc = "staggered timing" if self.is_melodic else "simultaneous notes"
@@ -229,23 +306,7 @@ class BaseIntervalExercise(BaseExercise):
         Returns:
             int: Number of semitones
         """
-        interval_map = {
-            "unison": 0,
-            "minor_second": 1,
-            "major_second": 2,
-            "minor_third": 3,
-            "major_third": 4,
-            "perfect_fourth": 5,
-            "augmented_fourth": 6,
-            "diminished_fifth": 6,
-            "perfect_fifth": 7,
-            "minor_sixth": 8,
-            "major_sixth": 9,
-            "minor_seventh": 10,
-            "major_seventh": 11,
-            "octave": 12,
-        }
-        return interval_map.get(interval, 0)
+        return INTERVAL_SEMITONES.get(interval, 0)
 
     def _get_interval_display_name(self, interval: str) -> str:
         """
@@ -257,23 +318,7 @@ class BaseIntervalExercise(BaseExercise):
         Returns:
             str: Display name for the interval
         """
-        display_names = {
-            "unison": "Unison",
-            "minor_second": "Minor Second",
-            "major_second": "Major Second",
-            "minor_third": "Minor Third",
-            "major_third": "Major Third",
-            "perfect_fourth": "Perfect Fourth",
-            "augmented_fourth": "Augmented Fourth",
-            "diminished_fifth": "Diminished Fifth",
-            "perfect_fifth": "Perfect Fifth",
-            "minor_sixth": "Minor Sixth",
-            "major_sixth": "Major Sixth",
-            "minor_seventh": "Minor Seventh",
-            "major_seventh": "Major Seventh",
-            "octave": "Octave",
-        }
-        return display_names.get(interval, interval.replace("_", " ").title())
+        return INTERVAL_DISPLAY_NAMES.get(interval, interval.replace("_", " ").title())
 
     def _get_interval_notation(self, interval: str) -> str:
         """
@@ -285,23 +330,7 @@ class BaseIntervalExercise(BaseExercise):
         Returns:
             str: Interval notation (e.g., "3m", "3M", "4J", "5J", "8J")
         """
-        notation_map = {
-            "unison": "1J",
-            "minor_second": "2m",
-            "major_second": "2M",
-            "minor_third": "3m",
-            "major_third": "3M",
-            "perfect_fourth": "4J",
-            "augmented_fourth": "4+",
-            "diminished_fifth": "5°",
-            "perfect_fifth": "5J",
-            "minor_sixth": "6m",
-            "major_sixth": "6M",
-            "minor_seventh": "7m",
-            "major_seventh": "7M",
-            "octave": "8J",
-        }
-        return notation_map.get(interval, interval.replace("_", " ").title())
+        return INTERVAL_NOTATIONS.get(interval, interval.replace("_", " ").title())
 
     def validate_config(self, config: dict[str, Any]) -> dict[str, Any]:
         """
@@ -2,7 +2,15 @@
 Basic tests for the Open Ear Trainer application.
 """
 
-from django.test import TestCase
+import gzip
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from api_app.views import clear_generate_memo, exercise_registry
+from audio_app.synthesizer import NOTE_TABLE, AudioSynthesizer
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -25,6 +33,13 @@ class BasicTestCase(TestCase):
 class APITestCase(APITestCase):
     """API endpoint tests."""
 
+    def setUp(self):
+        # Memoized questions and in-memory audio outlive a single test
+        clear_generate_memo()
+        AudioSynthesizer.clear_memory_cache()
+        self.addCleanup(clear_generate_memo)
+        self.addCleanup(AudioSynthesizer.clear_memory_cache)
+
     def test_exercises_list_endpoint(self):
         """Test that exercises API endpoint is accessible."""
         url = reverse("api:exercise-list")
@@ -32,6 +47,234 @@ class APITestCase(APITestCase):
         # Should return 200 even if no exercises exist
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_exercises_list_not_modified(self):
+        """Test that a matching If-None-Match returns 304."""
+        url = reverse("api:exercise-list")
+        response = self.client.get(url)
+        self.assertIn("ETag", response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unexpected_error_returns_internal_error(self):
+        """Test that unhandled view errors become a JSON 500 response."""
+        with mock.patch.object(
+            exercise_registry, "get_exercise_list_json", side_effect=RuntimeError
+        ):
+            response = self.client.get(reverse("api:exercise-list"))
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(
+            response.json(),
+            {"error": "internal_error", "message": "Failed to get exercise list"},
+        )
+
+    def test_exercises_list_gzip(self):
+        """Test that gzip-capable clients get the precompressed list."""
+        url = reverse("api:exercise-list")
+        plain = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_exercise_instructions_endpoint(self):
+        """Test that exercise instructions are returned."""
+        url = reverse(
+            "api:exercise-instructions",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hints", response.json())
+
+    def test_exercise_generate_endpoint(self):
+        """Test that a new exercise question is generated."""
+        url = reverse(
+            "api:exercise-generate",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root),
+        ):
+            response = self.client.get(url, {"question_number": 3, "unknown": "x"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["key"], "Question 3/20")
+        self.assertIn(data["correct_answer"], data["options"])
+
+    def test_exercise_generate_rejects_invalid_params(self):
+        """Test that malformed or out-of-range parameters return 400."""
+        url = reverse(
+            "api:exercise-generate",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        for octave in ["high", "-5", "0", "8", "99"]:
+            with self.subTest(octave=octave):
+                response = self.client.get(url, {"octave": octave})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.json()["error"], "validation_error")
+                self.assertIn("octave", response.json()["details"])
+
+    def test_exercise_generate_highest_octave(self):
+        """Test that the top interval note at the highest octave is valid MIDI."""
+        url = reverse(
+            "api:exercise-generate",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root),
+        ):
+            response = self.client.get(
+                url, {"octave": 7, "interval": "octave", "reference_note": "B"}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        context = response.json()["context"]
+        self.assertEqual(context["reference_note"], "B-7")
+        self.assertEqual(context["second_note"], "B-8")
+        midi_number, _ = NOTE_TABLE[context["second_note"]]
+        self.assertLessEqual(midi_number, 127)
+
+    def test_exercise_generate_resynthesizes_missing_audio(self):
+        """Test that memoized questions re-create audio deleted from disk."""
+        url = reverse(
+            "api:exercise-generate",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        params = {"reference_note": "C", "interval": "octave"}
+        other_params = {**params, "reference_note": "D"}
+        exercise = exercise_registry.get_exercise("combined_intervals_melodic")
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root, AUDIO_CACHE_ENABLED=True),
+            mock.patch.object(
+                exercise, "generate", wraps=exercise.generate
+            ) as generate,
+        ):
+            other_audio_url = self.client.get(url, other_params).json()["target_audio"]
+            audio_url = self.client.get(url, params).json()["target_audio"]
+            filename = audio_url.rstrip("/").rpartition("/")[2]
+            audio_path = Path(media_root, "audio", "cache", filename)
+            audio_path.unlink()
+
+            response = self.client.get(url, params)
+            self.assertEqual(response.json()["target_audio"], audio_url)
+            self.assertTrue(audio_path.exists())
+            self.assertEqual(generate.call_count, 3)
+
+            # Other memoized questions are still served without regenerating
+            response = self.client.get(url, other_params)
+            self.assertEqual(response.json()["target_audio"], other_audio_url)
+            self.assertEqual(generate.call_count, 3)
+
+    def test_exercise_check_endpoint(self):
+        """Test that an answer is checked against the given context."""
+        url = reverse(
+            "api:exercise-check",
+            kwargs={"exercise_id": "combined_intervals_melodic"},
+        )
+        response = self.client.post(
+            url,
+            {"answer": "3m", "context": {"correct_answer": "3m"}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["is_correct"])
+
+    def test_exercise_check_with_answer_token(self):
+        """Test that a generated question is checked through its signed token."""
+        exercise_id = "combined_intervals_melodic"
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root),
+        ):
+            data = self.client.get(
+                reverse("api:exercise-generate", kwargs={"exercise_id": exercise_id})
+            ).json()
+        url = reverse("api:exercise-check", kwargs={"exercise_id": exercise_id})
+
+        response = self.client.post(
+            url,
+            {"answer": data["correct_answer"], "context": data["context"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["is_correct"])
+
+        for forged_token in ["forged", 5, ["forged"]]:
+            with self.subTest(answer_token=forged_token):
+                context = {**data["context"], "answer_token": forged_token}
+                response = self.client.post(
+                    url, {"answer": "3m", "context": context}, format="json"
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        other_url = reverse(
+            "api:exercise-check",
+            kwargs={"exercise_id": "perfect_fourth_fifth_octave_melodic"},
+        )
+        response = self.client.post(
+            other_url,
+            {"answer": data["correct_answer"], "context": data["context"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_audio_file_endpoint(self):
+        """Test that cached audio files are served and other paths are not."""
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            override_settings(MEDIA_ROOT=media_root),
+        ):
+            cache_dir = os.path.join(media_root, "audio", "cache")
+            os.makedirs(cache_dir)
+            with open(os.path.join(cache_dir, "tone.wav"), "wb") as f:
+                f.write(b"RIFF")
+
+            url = reverse("api:audio-file", kwargs={"filename": "tone.wav"})
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.content, b"RIFF")
+            self.assertIn("immutable", response["Cache-Control"])
+
+            # Hot cache files are kept in memory once served
+            Path(cache_dir, "tone.wav").unlink()
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.content, b"RIFF")
+            Path(cache_dir, "tone.wav").write_bytes(b"RIFF")
+
+            for byte_range, expected_status, body, content_range in [
+                ("bytes=1-2", status.HTTP_206_PARTIAL_CONTENT, b"IF", "bytes 1-2/4"),
+                ("bytes=2-", status.HTTP_206_PARTIAL_CONTENT, b"FF", "bytes 2-3/4"),
+                ("bytes=-1", status.HTTP_206_PARTIAL_CONTENT, b"F", "bytes 3-3/4"),
+                (
+                    "bytes=9-",
+                    status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    b"",
+                    "bytes */4",
+                ),
+            ]:
+                with self.subTest(byte_range=byte_range):
+                    response = self.client.get(url, HTTP_RANGE=byte_range)
+                    self.assertEqual(response.status_code, expected_status)
+                    self.assertEqual(response.content, body)
+                    self.assertEqual(response["Content-Range"], content_range)
+
+            for filename, expected_status in [
+                ("missing.wav", status.HTTP_404_NOT_FOUND),
+                ("..", status.HTTP_400_BAD_REQUEST),
+                (".hidden.wav", status.HTTP_400_BAD_REQUEST),
+                ("cache", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+                ("notes.txt", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+            ]:
+                with self.subTest(filename=filename):
+                    url = reverse("api:audio-file", kwargs={"filename": filename})
+                    response = self.client.get(url)
+                    self.assertEqual(response.status_code, expected_status)
+
     def test_health_check(self):
         """Test basic health check."""
         # Simple test that the app is running
@@ -0,0 +1,119 @@
+"""
+Tests for the audio synthesizer.
+"""
+
+import filecmp
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from audio_app.synthesizer import AudioSynthesizer
+from django.test import SimpleTestCase, override_settings
+
+
+class AudioCacheTestCase(SimpleTestCase):
+    """Audio cache entries must never change once written."""
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.media_root = media_root.name
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root, AUDIO_CACHE_ENABLED=True
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.synthesizer = AudioSynthesizer()
+
+    def test_output_path_reuse_keeps_cache_entries(self):
+        """Test that rewriting an output path leaves its cache entry intact."""
+        output_path = os.path.join(self.media_root, "out.wav")
+
+        notes_path = self.synthesizer.synthesize_notes(
+            ["C"], 1.0, output_path=output_path
+        )
+        notes_audio = Path(notes_path).read_bytes()
+        self.assertNotEqual(notes_path, output_path)
+        self.assertFalse(Path(notes_path).samefile(output_path))
+
+        chord_path = self.synthesizer.synthesize_chord(
+            ["C", "E"], 2.0, output_path=output_path
+        )
+        self.assertNotEqual(chord_path, notes_path)
+        self.assertTrue(filecmp.cmp(chord_path, output_path, shallow=False))
+        self.assertEqual(Path(notes_path).read_bytes(), notes_audio)
+
+        # No temporary files are left behind in the cache directory
+        self.assertEqual(
+            sorted(path.name for path in Path(self.synthesizer.cache_dir).iterdir()),
+            sorted([Path(notes_path).name, Path(chord_path).name]),
+        )
+
+    def test_audio_url_only_for_media_files(self):
+        """Test that only files inside MEDIA_ROOT get an API URL."""
+        inside = str(Path(self.media_root, "audio", "cache", "tone.wav"))
+        sibling = f"{self.media_root}_old/audio/tone.wav"
+        self.assertEqual(self.synthesizer.get_audio_url(inside), "/api/audio/tone.wav/")
+        self.assertEqual(self.synthesizer.get_audio_url(sibling), sibling)
+
+    def test_batch_matches_individual_calls(self):
+        """Test that batch synthesis returns the paths of the single calls."""
+        requests = [
+            {"type": "harmonic_interval", "note1": "C", "note2": "G"},
+            {"type": "notes", "notes": ["E"], "duration": 1.0},
+            {"type": "progression", "progression": [["C", "E", "G"], ["F", "A"]]},
+        ]
+        paths = self.synthesizer.synthesize_batch(requests)
+
+        self.assertEqual(
+            paths,
+            [
+                self.synthesizer.synthesize_harmonic_interval("C", "G"),
+                self.synthesizer.synthesize_notes(["E"], 1.0),
+                self.synthesizer.synthesize_progression([["C", "E", "G"], ["F", "A"]]),
+            ],
+        )
+        for path in paths:
+            self.assertTrue(Path(path).is_file())
+
+        with self.assertRaises(ValueError):
+            self.synthesizer.synthesize_batch([{"type": "audio_url"}])
+
+    def test_progression_key_depends_on_chords(self):
+        """Test that progressions of the same length are cached separately."""
+        first = self.synthesizer.synthesize_progression([["C", "E"], ["G"]])
+        second = self.synthesizer.synthesize_progression([["C"], ["E", "G"]])
+        self.assertNotEqual(first, second)
+        self.assertEqual(
+            self.synthesizer.synthesize_progression([["C", "E"], ["G"]]), first
+        )
+
+
+class PianoToneTestCase(SimpleTestCase):
+    """Synthetic piano tones must match the direct formula."""
+
+    def test_matches_reference_formula(self):
+        """Test tones against sin(2πft) + 0.3 sin(4πft) + 0.1 sin(6πft)."""
+        for frequency, num_samples, sample_rate in [
+            (261.63, 44100, 44100),
+            (440.0, 88200, 44100),
+            (27.5, 22050, 22050),
+            (4186.0, 66150, 44100),
+        ]:
+            with self.subTest(frequency=frequency, num_samples=num_samples):
+                t = np.arange(num_samples) / sample_rate
+                phase = 2 * np.pi * frequency * t
+                expected = (
+                    np.sin(phase) + 0.3 * np.sin(2 * phase) + 0.1 * np.sin(3 * phase)
+                )
+                expected *= np.exp(-3 * t) * (1 - np.exp(-20 * t))
+                expected *= 0.7 / np.abs(expected).max()
+
+                tone = AudioSynthesizer._generate_piano_tone(
+                    frequency, num_samples, sample_rate
+                )
+                self.assertEqual(tone.dtype, np.float32)
+                self.assertEqual(len(tone), num_samples)
+                self.assertFalse(tone.flags.writeable)
+                np.testing.assert_allclose(tone, expected, rtol=0, atol=1e-6)